@@ -4,6 +4,8 @@ Prosty interaktywny CLI do eksperymentowania z SimpleCoffeeMachine.
 Uruchom: python run_coffee_cli.py
 """
 
+import io
+import sys
 from datetime import timedelta
 from src.coffee_machine.coffee_machine import SimpleCoffeeMachine
 from src.coffee_machine.coffee_recipe import CoffeeRecipe, CoffeeRecipeGrindLevel
@@ -36,15 +38,154 @@ Komendy:
 """)
 
 def print_status(machine):
-    print("STATE:", machine.state)
-    print("Active recipe:", machine.active_recipe.name if machine.active_recipe else None)
-    print("Dirty count:", machine.dirty_count)
-    print("Last cleaned:", machine.last_cleaned_ts)
-    print("Water: {}/{}".format(machine.water_tank.current_level, machine.water_tank.maximum_level))
-    print("Beans: {}/{}".format(machine.bean_container.current_level, machine.bean_container.maximum_level))
-    print("Cleaning scheduled:", getattr(machine, "cleaning_scheduled", False))
+    # jeden zapis do stdout zamiast osobnego print() na każdą linię
+    recipe = machine.active_recipe
+    water = machine.water_tank
+    beans = machine.bean_container
+    sys.stdout.write(
+        f"STATE: {machine.state.name}\n"
+        f"Active recipe: {recipe.name if recipe else None}\n"
+        f"Dirty count: {machine.dirty_count}\n"
+        f"Last cleaned: {machine.last_cleaned_at}\n"
+        f"Water: {water.current_level}/{water.maximum_level}\n"
+        f"Beans: {beans.current_level}/{beans.maximum_level}\n"
+        f"Cleaning scheduled: {machine.cleaning_scheduled}\n"
+    )
+
+
+# --- obsługa komend: każda funkcja dostaje (machine, arg) ---
+def cmd_help(machine, arg):
+    print_help()
+
+
+def cmd_list(machine, arg):
+    print("Dostępne przepisy:")
+    for k, r in RECIPES.items():
+        print(f"  {k} — water={r.water_ml}ml beans={r.beans_g}g grind={r.grind.name if r.grind else None}")
+
+
+def cmd_select(machine, name):
+    if not name:
+        print("Użycie: select <name>")
+        return
+    recipe = RECIPES.get(name)
+    if recipe is None:
+        print(f"Brak przepisu: {name}")
+        return
+    machine.select_recipe(recipe)
+    print("Wybrano przepis:", name)
+
+
+def cmd_brew(machine, arg):
+    try:
+        result = machine.brew()
+    except Exception as exc:
+        # pokaż informację o błędzie, ale nie przerywaj CLI
+        print("Błąd podczas parzenia:", type(exc).__name__, exc)
+        return
+
+    # result to BrewDecision albo enum name w SimpleCoffeeMachine
+    if isinstance(result, BrewDecision):
+        print("Result:", result.name)
+    else:
+        # fallback — SimpleCoffeeMachine zwraca pewne stringi w minimalnej wersji
+        print("Result:", result)
+    print_status(machine)
+
+
+def cmd_refill_water(machine, arg):
+    if not arg:
+        print("Użycie: refill_water <ml>")
+        return
+    try:
+        amount = int(arg)
+    except ValueError:
+        print("Nieprawidłowa liczba")
+        return
+    try:
+        res = machine.refill_water(amount)
+        # refill_policy może zwracać enum lub zasób również
+        print("Refill result:", res.name)
+    except Exception as exc:
+        print("Błąd refill:", type(exc).__name__, exc)
+    print_status(machine)
+
+
+def cmd_refill_beans(machine, arg):
+    if not arg:
+        print("Użycie: refill_beans <g>")
+        return
+    try:
+        amount = int(arg)
+    except ValueError:
+        print("Nieprawidłowa liczba")
+        return
+    try:
+        res = machine.refill_beans(amount)
+        print("Refill result:", res.name)
+    except Exception as exc:
+        print("Błąd refill:", type(exc).__name__, exc)
+    print_status(machine)
+
+
+def cmd_clean(machine, arg):
+    machine.clean()
+    print("Wykonano czyszczenie.")
+    print_status(machine)
+
+
+def cmd_status(machine, arg):
+    print_status(machine)
+
+
+HANDLERS = {
+    "help": cmd_help,
+    "list": cmd_list,
+    "select": cmd_select,
+    "brew": cmd_brew,
+    "refill_water": cmd_refill_water,
+    "refill_beans": cmd_refill_beans,
+    "clean": cmd_clean,
+    "status": cmd_status,
+}
+
+
+# rozmiar bufora wyjścia, gdy CLI jest sterowany skryptem (stdin z potoku)
+OUTPUT_BUFFER_SIZE = 16384
+
+
+def read_commands():
+    """
+    Zwraca kolejne linie wejścia.
+
+    W terminalu używa input() z promptem. Gdy stdin jest potokiem/plikiem,
+    czyta linie z buforowanego strumienia i opróżnia bufor stdout po
+    każdej obsłużonej komendzie.
+    """
+    try:
+        if sys.stdin.isatty():
+            while True:
+                yield input("> ")
+        else:
+            reader = io.TextIOWrapper(sys.stdin.buffer,
+                                      encoding=sys.stdin.encoding,
+                                      line_buffering=False)
+            for line in reader:
+                yield line
+                sys.stdout.flush()
+    except (KeyboardInterrupt, EOFError):
+        pass
+    print("\nKoniec (CTRL-C/EOF).")
+
 
 def main():
+    if not sys.stdin.isatty():
+        # skrypt/potok: jeden zapis na komendę zamiast zapisu na każdy print()
+        sys.stdout = io.TextIOWrapper(
+            io.BufferedWriter(sys.stdout.buffer, OUTPUT_BUFFER_SIZE),
+            encoding=sys.stdout.encoding,
+        )
+
     # inicjalizacja maszynki z domyślnymi politykami
     water = WaterTank(maximum_level=500, initial_level=150)
     beans = BeanContainer(maximum_grams=500, initial_grams=50)
@@ -58,105 +199,32 @@ def main():
     print("Simple Coffee CLI. Wpisz 'help' aby zobaczyć dostępne komendy.")
     print_status(machine)
 
-    while True:
-        try:
-            raw = input("> ").strip()
-        except (KeyboardInterrupt, EOFError):
-            print("\nKoniec (CTRL-C/EOF).")
-            break
-
+    for raw in read_commands():
+        raw = raw.strip()
         if not raw:
             continue
 
-        parts = raw.split()
+        # dowolne białe znaki jako separator; argumentem jest drugie słowo
+        parts = raw.split(None, 2)
         cmd = parts[0].lower()
+        arg = parts[1] if len(parts) > 1 else ""
+
+        if cmd in ("quit", "q"):
+            print("Koniec.")
+            break
+
+        handler = HANDLERS.get(cmd)
+        if handler is None:
+            print("Nieznana komenda. Wpisz 'help'.")
+            continue
 
         try:
-            if cmd in ("quit", "q"):
-                print("Koniec.")
-                break
-
-            elif cmd == "help":
-                print_help()
-
-            elif cmd == "list":
-                print("Dostępne przepisy:")
-                for k, r in RECIPES.items():
-                    print(f"  {k} — water={r.water_ml}ml beans={r.beans_g}g grind={r.grind.name if r.grind else None}")
-
-            elif cmd == "select":
-                if len(parts) < 2:
-                    print("Użycie: select <name>")
-                    continue
-                name = parts[1]
-                if name not in RECIPES:
-                    print(f"Brak przepisu: {name}")
-                    continue
-                machine.select_recipe(RECIPES[name])
-                print("Wybrano przepis:", name)
-
-            elif cmd == "brew":
-                try:
-                    result = machine.brew()
-                except Exception as exc:
-                    # pokaż informację o błędzie, ale nie przerywaj CLI
-                    print("Błąd podczas parzenia:", type(exc).__name__, exc)
-                    continue
-
-                # result to BrewDecision albo enum name w SimpleCoffeeMachine
-                if isinstance(result, BrewDecision):
-                    print("Result:", result.name)
-                else:
-                    # fallback — SimpleCoffeeMachine zwraca pewne stringi w minimalnej wersji
-                    print("Result:", result)
-                print_status(machine)
-
-            elif cmd == "refill_water":
-                if len(parts) < 2:
-                    print("Użycie: refill_water <ml>")
-                    continue
-                try:
-                    amount = int(parts[1])
-                except ValueError:
-                    print("Nieprawidłowa liczba")
-                    continue
-                try:
-                    res = machine.refill_water(amount)
-                    # refill_policy może zwracać enum lub zasób również
-                    print("Refill result:", res)
-                except Exception as exc:
-                    print("Błąd refill:", type(exc).__name__, exc)
-                print_status(machine)
-
-            elif cmd == "refill_beans":
-                if len(parts) < 2:
-                    print("Użycie: refill_beans <g>")
-                    continue
-                try:
-                    amount = int(parts[1])
-                except ValueError:
-                    print("Nieprawidłowa liczba")
-                    continue
-                try:
-                    res = machine.refill_beans(amount)
-                    print("Refill result:", res)
-                except Exception as exc:
-                    print("Błąd refill:", type(exc).__name__, exc)
-                print_status(machine)
-
-            elif cmd == "clean":
-                machine.clean()
-                print("Wykonano czyszczenie.")
-                print_status(machine)
-
-            elif cmd == "status":
-                print_status(machine)
-
-            else:
-                print("Nieznana komenda. Wpisz 'help'.")
+            handler(machine, arg)
         except Exception as exc:
             # bezpieczeństwo: łapiemy wszystko, żeby CLI nie padł
             print("Nieoczekiwany błąd:", type(exc).__name__, exc)
 
+    sys.stdout.flush()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,61 @@
+# src/coffee_machine/_reservoir.py
+
+
+class _Reservoir:
+    """
+    Common base of WaterTank and BeanContainer.
+
+    Holds the instance layout and the read-only queries, which are identical
+    for both containers. Constructors and mutating methods stay in the
+    concrete classes, because their argument names, error types and messages
+    differ.
+
+    Slots:
+        _current_level: current amount in the container's unit.
+        _maximum_level: maximum capacity in the container's unit.
+        _ratio: fulfillment_ratio cache, kept in sync by every mutation.
+        _repr: __repr__ cache, or None when it has to be rebuilt.
+
+    The levels are exposed through read-only properties, so the invariants
+    and both caches can only be changed by the concrete mutating methods.
+    """
+
+    __slots__ = ("_maximum_level", "_current_level", "_ratio", "_repr")
+
+    @property
+    def current_level(self) -> int:
+        """Current amount in the container's unit (read-only)."""
+        return self._current_level
+
+    @property
+    def maximum_level(self) -> int:
+        """Maximum capacity in the container's unit (read-only)."""
+        return self._maximum_level
+
+    @property
+    def missing_capacity(self) -> int:
+        """
+        Amount missing to reach maximum capacity.
+
+        Returns:
+            int: maximum_level - current_level
+        """
+        return self._maximum_level - self._current_level
+
+    @property
+    def fulfillment_ratio(self) -> float:
+        """
+        Current fill ratio in range [0.0, 1.0].
+
+        Returns:
+            float: current_level / maximum_level
+        """
+        return self._ratio
+
+    def is_empty(self) -> bool:
+        """Return True if the container is empty (current == 0)."""
+        return self._current_level == 0
+
+    def is_full(self) -> bool:
+        """Return True if the container is full (current == maximum)."""
+        return self._current_level == self._maximum_level
@@ -1,4 +1,6 @@
-from enum import Enum, auto
+from enum import IntEnum, auto
+from typing import NoReturn, final
+from src.coffee_machine._reservoir import _Reservoir
 from src.errors import (
     InvalidBeanContainerConfigError,
     InvalidBeanOperationError,
@@ -6,7 +8,7 @@ from src.errors import (
 )
 
 
-class BeanContainerRefillStatus(Enum):
+class BeanContainerRefillStatus(IntEnum):
     """
     Result status returned by BeanContainer.refill().
     """
@@ -18,7 +20,12 @@ class BeanContainerRefillStatus(Enum):
     """Container is still not full after refill."""
 
 
-class BeanContainer:
+_NOW_FULL = BeanContainerRefillStatus.NOW_FULL
+_STILL_NOT_FULL = BeanContainerRefillStatus.STILL_NOT_FULL
+
+
+@final
+class BeanContainer(_Reservoir):
     """
     Domain model representing a bean/container of coffee (measured in grams).
 
@@ -28,11 +35,16 @@ class BeanContainer:
     - provide domain queries (is_empty, is_full, missing_capacity,
         fulfillment_ratio).
 
+    The class is final and its instance layout is fixed by __slots__; the
+    level slots are private and only the mutating methods write them.
+
     Invariants:
     - 0 <= current_level <= maximum_level
     - maximum_level > 0
     """
 
+    __slots__ = ()
+
     def __init__(self, maximum_grams: int, initial_grams: int) -> None:
         """
         Initialize a BeanContainer.
@@ -45,6 +57,24 @@ class BeanContainer:
         Raises:
             InvalidBeanContainerConfigError: on invalid constructor arguments.
         """
+        if maximum_grams <= 0 or not 0 <= initial_grams <= maximum_grams:
+            self._raise_config_error(maximum_grams, initial_grams)
+
+        self._maximum_level = maximum_grams
+        self._current_level = initial_grams
+        # fulfillment_ratio cache, refreshed by every mutating method
+        self._ratio = initial_grams / maximum_grams
+        # __repr__ cache, built on first use and reset on every mutation
+        self._repr = None
+
+    @staticmethod
+    def _raise_config_error(maximum_grams: int,
+                            initial_grams: int) -> NoReturn:
+        """
+        Raise the error describing why the constructor arguments are invalid.
+
+        Kept out of __init__ so the valid path performs a single check.
+        """
         if maximum_grams <= 0:
             raise InvalidBeanContainerConfigError(
                 "maximum_grams should be greater than zero"
@@ -55,59 +85,17 @@ class BeanContainer:
                 "initial_grams cannot be less than zero"
             )
 
-        if initial_grams > maximum_grams:
-            raise InvalidBeanContainerConfigError(
-                "initial_grams should not be greater than maximum_grams"
-            )
-
-        self._maximum_grams = maximum_grams
-        self._current_grams = initial_grams
-
-    @property
-    def missing_capacity(self) -> int:
-        """
-        Amount of grams missing to reach maximum capacity.
-
-        Returns:
-            int: maximum_grams - current_grams
-        """
-        return self._maximum_grams - self._current_grams
-
-    @property
-    def fulfillment_ratio(self) -> float:
-        """
-        Current fill ratio in range [0.0, 1.0].
-
-        Returns:
-            float: current_grams / maximum_grams
-        """
-        return self._current_grams / self._maximum_grams
-
-    @property
-    def current_level(self) -> int:
-        """
-        Current amount of beans in grams.
-
-        Returns:
-            int
-        """
-        return self._current_grams
-
-    @property
-    def maximum_level(self) -> int:
-        """
-        Maximum capacity in grams.
-
-        Returns:
-            int
-        """
-        return self._maximum_grams
+        raise InvalidBeanContainerConfigError(
+            "initial_grams should not be greater than maximum_grams"
+        )
 
     def __repr__(self) -> str:
-        return (
-            f"{self.__class__.__name__}(max={self._maximum_grams}g,"
-            f" current={self._current_grams}g)"
-        )
+        if self._repr is None:
+            self._repr = (
+                f"{self.__class__.__name__}(max={self._maximum_level}g,"
+                f" current={self._current_level}g)"
+            )
+        return self._repr
 
     def consume_beans(self, amount_grams: int) -> None:
         """
@@ -128,13 +116,44 @@ class BeanContainer:
             raise InvalidBeanOperationError("Consumption amount must be "
                                             "greater than zero")
 
-        if self._current_grams - amount_grams >= 0:
-            self._current_grams -= amount_grams
+        if amount_grams <= self._current_level:
+            self._current_level -= amount_grams
+            self._ratio = self._current_level / self._maximum_level
+            self._repr = None
             return
 
         raise NotEnoughBeansError("Not enough beans to consume  "
                                   "the requested amount")
 
+    def try_consume(self, amount_grams: int) -> bool:
+        """
+        Consume beans if enough are available, without raising otherwise.
+
+        Non-raising variant of consume_beans() for callers that expect to
+        run empty regularly (e.g. simulations).
+
+        Args:
+            amount_grams: grams to consume (must be > 0).
+
+        Returns:
+            bool: True if the beans were consumed, False if there was not
+                  enough beans (state is not modified).
+
+        Raises:
+            InvalidBeanOperationError: if amount_grams <= 0.
+        """
+        if amount_grams <= 0:
+            raise InvalidBeanOperationError("Consumption amount must be "
+                                            "greater than zero")
+
+        if amount_grams <= self._current_level:
+            self._current_level -= amount_grams
+            self._ratio = self._current_level / self._maximum_level
+            self._repr = None
+            return True
+
+        return False
+
     def refill(self, refill_grams: int) -> BeanContainerRefillStatus:
         """
         Refill the container by a specified amount (grams).
@@ -157,19 +176,15 @@ class BeanContainer:
             raise InvalidBeanOperationError("Refill amount must be "
                                             "greater than zero")
 
-        new_level = self._current_grams + refill_grams
-
-        if new_level >= self._maximum_grams:
-            self._current_grams = self._maximum_grams
-            return BeanContainerRefillStatus.NOW_FULL
-
-        self._current_grams = new_level
-        return BeanContainerRefillStatus.STILL_NOT_FULL
+        new_level = self._current_level + refill_grams
 
-    def is_empty(self) -> bool:
-        """Return True if the container is empty (0 grams)."""
-        return self._current_grams == 0
+        if new_level >= self._maximum_level:
+            self._current_level = self._maximum_level
+            self._ratio = 1.0
+            self._repr = None
+            return _NOW_FULL
 
-    def is_full(self) -> bool:
-        """Return True if the container is full (current == maximum)."""
-        return self._current_grams == self._maximum_grams
+        self._current_level = new_level
+        self._ratio = new_level / self._maximum_level
+        self._repr = None
+        return _STILL_NOT_FULL
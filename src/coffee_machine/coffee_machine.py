@@ -1,10 +1,58 @@
 from datetime import datetime
+from enum import IntEnum
+import time
 from src.coffee_machine.coffee_recipe import CoffeeRecipe
-from src.coffee_machine.policies.brew_policy import BrewDecision
-from src.coffee_machine.policies.cleaning_policy import CleaningAction
+from src.coffee_machine.policies.brew_policy import (BrewDecision,
+                                                     DefaultBrewPolicy)
+from src.coffee_machine.policies.cleaning_policy import (CleaningAction,
+                                                         DefaultCleaningPolicy)
+
+
+class MachineState(IntEnum):
+    # values mirror BrewDecision (IDLE pairs with OK), so a state compares
+    # equal only to the decision that leads to it
+    IDLE = BrewDecision.OK.value
+    OUT_OF_WATER = BrewDecision.OUT_OF_WATER.value
+    OUT_OF_BEANS = BrewDecision.OUT_OF_BEANS.value
+    RECIPE_FORBIDDEN = BrewDecision.RECIPE_FORBIDDEN.value
+    NEEDS_CLEANING = BrewDecision.NEEDS_CLEANING.value
+    ERROR = BrewDecision.ERROR.value
+
+
+# state entered when the brew policy refuses to brew
+_DECISION_STATES = {
+    BrewDecision.OUT_OF_WATER: MachineState.OUT_OF_WATER,
+    BrewDecision.OUT_OF_BEANS: MachineState.OUT_OF_BEANS,
+    BrewDecision.RECIPE_FORBIDDEN: MachineState.RECIPE_FORBIDDEN,
+    BrewDecision.NEEDS_CLEANING: MachineState.NEEDS_CLEANING,
+    BrewDecision.ERROR: MachineState.ERROR,
+}
+
+_OK = BrewDecision.OK
+_OUT_OF_WATER = BrewDecision.OUT_OF_WATER
+_OUT_OF_BEANS = BrewDecision.OUT_OF_BEANS
+_RECIPE_FORBIDDEN = BrewDecision.RECIPE_FORBIDDEN
+_NEEDS_CLEANING = BrewDecision.NEEDS_CLEANING
+_NO_ACTION = CleaningAction.NO_ACTION
+_IMMEDIATE = CleaningAction.IMMEDIATE
+_SCHEDULE = CleaningAction.SCHEDULE
 
 
 class SimpleCoffeeMachine:
+    __slots__ = (
+        "water_tank",
+        "bean_container",
+        "brew_policy",
+        "cleaning_policy",
+        "refill_policy",
+        "state",
+        "active_recipe",
+        "dirty_count",
+        "last_cleaned_ts",
+        "last_cleaned_at",
+        "cleaning_scheduled",
+    )
+
     def __init__(self, water_tank, bean_container,
                  brew_policy, cleaning_policy, refill_policy):
         self.water_tank = water_tank
@@ -13,10 +61,11 @@ class SimpleCoffeeMachine:
         self.cleaning_policy = cleaning_policy
         self.refill_policy = refill_policy
 
-        self.state = "IDLE"
+        self.state = MachineState.IDLE
         self.active_recipe = None
         self.dirty_count = 0
-        self.last_cleaned_ts = None
+        self.last_cleaned_ts = None  # time.monotonic_ns() of the last cleaning
+        self.last_cleaned_at = None  # wall-clock time of the last cleaning
         self.cleaning_scheduled = False  # flag set when cleaning is scheduled (SCHEDULE)
 
     def select_recipe(self, recipe: CoffeeRecipe):
@@ -28,50 +77,89 @@ class SimpleCoffeeMachine:
 
         recipe = self.active_recipe
 
-        decision = self.brew_policy.can_brew(
-            recipe,
-            self.water_tank.current_level,
-            self.bean_container.current_level,
-            maintenance_state={"dirty_count": self.dirty_count}
-        )
-
-        if decision is not BrewDecision.OK:
-            self.state = decision.name
+        water_ml = recipe.water_ml
+        beans_g = recipe.beans_g
+        dirty_count = self.dirty_count
+
+        brew_policy = self.brew_policy
+        if type(brew_policy) is DefaultBrewPolicy:
+            # inlined DefaultBrewPolicy.can_brew (same checks, same order)
+            if not water_ml and not beans_g:
+                decision = (_OK if brew_policy.allow_recipe_with_no_requirements
+                            else _RECIPE_FORBIDDEN)
+            elif self.water_tank.current_level < water_ml:
+                decision = _OUT_OF_WATER
+            elif self.bean_container.current_level < beans_g:
+                decision = _OUT_OF_BEANS
+            elif dirty_count >= brew_policy.clean_threshold:
+                decision = _NEEDS_CLEANING
+            else:
+                decision = _OK
+        else:
+            decision = brew_policy.can_brew(
+                recipe,
+                self.water_tank.current_level,
+                self.bean_container.current_level,
+                dirty_count
+            )
+
+        if decision is not _OK:
+            self.state = _DECISION_STATES[decision]
             return decision
 
-        if recipe.requires_water():
-            self.water_tank.consume_water(recipe.water_ml)
+        if water_ml:
+            self.water_tank.consume_water(water_ml)
 
-        if recipe.requires_beans():
-            self.bean_container.consume_beans(recipe.beans_g)
+        if beans_g:
+            self.bean_container.consume_beans(beans_g)
 
         # update maintenance
-        self.dirty_count += 1
-
-        cleaning_action = self.cleaning_policy.evaluate(
-            self.dirty_count, self.last_cleaned_ts
-        )
+        dirty_count += 1
+        self.dirty_count = dirty_count
+
+        cleaning_policy = self.cleaning_policy
+        if type(cleaning_policy) is DefaultCleaningPolicy:
+            # inlined DefaultCleaningPolicy.evaluate
+            last_cleaned_ts = self.last_cleaned_ts
+            max_ns = cleaning_policy._max_ns
+            if (max_ns is not None and last_cleaned_ts is not None
+                    and time.monotonic_ns() - last_cleaned_ts >= max_ns):
+                cleaning_action = _IMMEDIATE
+            elif dirty_count < cleaning_policy.schedule_threshold:
+                cleaning_action = _NO_ACTION
+            elif dirty_count < cleaning_policy.immediate_threshold:
+                cleaning_action = _SCHEDULE
+            else:
+                cleaning_action = _IMMEDIATE
+        else:
+            cleaning_action = cleaning_policy.evaluate(
+                dirty_count, self.last_cleaned_ts
+            )
 
-        if cleaning_action is CleaningAction.IMMEDIATE:
-            self.state = "NEEDS_CLEANING"
-        elif cleaning_action is CleaningAction.SCHEDULE:
+        if cleaning_action is _IMMEDIATE:
+            self.state = MachineState.NEEDS_CLEANING
+        elif cleaning_action is _SCHEDULE:
             # set scheduled flag but remain IDLE
             self.cleaning_scheduled = True
-            self.state = "IDLE"
+            self.state = MachineState.IDLE
         else:
-            self.state = "IDLE"
+            self.state = MachineState.IDLE
 
-        return BrewDecision.OK
+        return _OK
 
     def clean(self):
         """
         Perform cleaning now: reset dirty_count and record timestamp.
         After cleaning, machine is IDLE and scheduled flag is cleared.
+
+        last_cleaned_ts (monotonic) drives the cleaning policy,
+        last_cleaned_at (wall clock) is kept for display only.
         """
         self.dirty_count = 0
-        self.last_cleaned_ts = datetime.utcnow()
+        self.last_cleaned_ts = time.monotonic_ns()
+        self.last_cleaned_at = datetime.utcnow()
         self.cleaning_scheduled = False
-        self.state = "IDLE"
+        self.state = MachineState.IDLE
 
     def schedule_cleaning(self):
         """Mark cleaning as scheduled (non-blocking)."""
@@ -2,6 +2,7 @@
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Optional
+from weakref import WeakValueDictionary
 from src.errors import InvalidRecipeError
 
 
@@ -14,6 +15,10 @@ class CoffeeRecipeGrindLevel(Enum):
 MAX_WATER_ML = 2000
 MAX_BEANS_G = 500
 
+# canonical recipes handed out by CoffeeRecipe.get_or_create(); an entry
+# lives only as long as someone else holds the recipe
+_INTERNED: "WeakValueDictionary[tuple, CoffeeRecipe]" = WeakValueDictionary()
+
 
 @dataclass(frozen=True)
 class CoffeeRecipe:
@@ -54,13 +59,82 @@ class CoffeeRecipe:
                 "grind must be a CoffeeRecipeGrindLevel or None"
             )
 
+        self._init_derived()
+
+    @classmethod
+    def unchecked(
+        cls,
+        name: str,
+        water_ml: int,
+        beans_g: int,
+        grind: Optional[CoffeeRecipeGrindLevel] = None,
+    ) -> "CoffeeRecipe":
+        """
+        Build a recipe without running validation.
+
+        Use only when the inputs are already known to be valid (e.g. recipes
+        loaded from a trusted, pre-validated source in a tight loop);
+        invalid values are not detected.
+        """
+        recipe = object.__new__(cls)
+        object.__setattr__(recipe, "name", name)
+        object.__setattr__(recipe, "water_ml", water_ml)
+        object.__setattr__(recipe, "beans_g", beans_g)
+        object.__setattr__(recipe, "grind", grind)
+        recipe._init_derived()
+        return recipe
+
+    @classmethod
+    def get_or_create(
+        cls,
+        name: str,
+        water_ml: int,
+        beans_g: int,
+        grind: Optional[CoffeeRecipeGrindLevel] = None,
+    ) -> "CoffeeRecipe":
+        """
+        Return the canonical recipe for the given fields.
+
+        Equal arguments give the same instance for as long as it is in use,
+        so equality checks between such recipes stop at the identity test
+        in __eq__. A new recipe is validated like a regular constructor
+        call.
+        """
+        # argument types are part of the key: 30.0 == 30 and True == 1, so
+        # without them an argument the constructor rejects (or treats
+        # differently) could map to a recipe interned from valid arguments
+        try:
+            key = (cls, type(name), name, type(water_ml), water_ml,
+                   type(beans_g), beans_g, grind)
+            recipe = _INTERNED.get(key)
+        except TypeError:
+            # unhashable argument: let the constructor report it
+            return cls(name, water_ml, beans_g, grind)
+        if recipe is None:
+            recipe = cls(name, water_ml, beans_g, grind)
+            _INTERNED[key] = recipe
+        return recipe
+
+    def _init_derived(self) -> None:
+        # values derived once from the fields (the recipe is immutable);
+        # stored as plain instance attributes, not dataclass fields, so
+        # fields()/asdict()/astuple() only see the four public fields
+        object.__setattr__(self, "_requires_water", self.water_ml > 0)
+        object.__setattr__(self, "_requires_beans", self.beans_g > 0)
+        object.__setattr__(self, "_repr", (
+            f"{self.__class__.__name__}("
+            f"name={self.name!r}, water_ml={self.water_ml}, "
+            f"beans_g={self.beans_g}, "
+            f"grind={self.grind.name if self.grind is not None else None})"
+        ))
+
     def requires_water(self) -> bool:
         """Return True if recipe requires water (water_ml > 0)."""
-        return self.water_ml > 0
+        return self._requires_water
 
     def requires_beans(self) -> bool:
         """Return True if recipe requires beans (beans_g > 0)."""
-        return self.beans_g > 0
+        return self._requires_beans
 
     def as_dict(self) -> dict:
         """Return a serializable mapping of the recipe."""
@@ -71,10 +145,19 @@ class CoffeeRecipe:
             "grind": self.grind.name if self.grind is not None else None,
         }
 
-    def __repr__(self) -> str:
+    def __eq__(self, other: object) -> bool:
+        # same comparison as the dataclass-generated one, identity first;
+        # __hash__ is still generated by the dataclass from the fields
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
         return (
-            f"{self.__class__.__name__}("
-            f"name={self.name!r}, water_ml={self.water_ml}, "
-            f"beans_g={self.beans_g}, "
-            f"grind={self.grind.name if self.grind is not None else None})"
+            self.name == other.name
+            and self.water_ml == other.water_ml
+            and self.beans_g == other.beans_g
+            and self.grind == other.grind
         )
+
+    def __repr__(self) -> str:
+        return self._repr
@@ -0,0 +1,273 @@
+# src/coffee_machine/container_array.py
+from enum import IntEnum
+from typing import List, Sequence, Tuple
+from src.coffee_machine.bean_container import BeanContainerRefillStatus
+from src.coffee_machine.water_tank import WaterTankRefillStatus
+from src.errors import (
+    InvalidBeanContainerConfigError,
+    InvalidBeanOperationError,
+    InvalidWaterTankConfigError,
+    InvalidWaterOperationError,
+)
+
+
+class _ContainerArray:
+    """
+    Structure-of-arrays model of many identical containers at once.
+
+    Intended for batch simulations (e.g. policy tuning over many machines),
+    where creating and calling one WaterTank/BeanContainer object per
+    machine dominates the run time. Levels live in two plain lists and every
+    operation processes all containers in a single pass. The lists are
+    updated in place, so a reference to `current` always sees the levels.
+
+    Invariants (per index i):
+    - 0 <= current[i] <= maximum[i]
+    - maximum[i] > 0
+    """
+
+    __slots__ = ("current", "maximum")
+
+    # set by subclasses to the container's domain exceptions and refill
+    # status members
+    _config_error: type
+    _operation_error: type
+    _now_full: IntEnum
+    _still_not_full: IntEnum
+
+    def __init__(self, maximum_level: int, initial_level: int,
+                 size: int) -> None:
+        """
+        Create `size` containers with the same maximum and initial level.
+
+        Raises:
+            config error of the container type: on invalid arguments
+            (same rules as the single-container class).
+        """
+        if maximum_level <= 0:
+            raise self._config_error(
+                "maximum_level should be greater than zero"
+            )
+
+        if initial_level < 0:
+            raise self._config_error(
+                "initial_level cannot be less than zero"
+            )
+
+        if initial_level > maximum_level:
+            raise self._config_error(
+                "initial_level should not be greater than maximum_level"
+            )
+
+        if size < 0:
+            raise self._config_error("size cannot be less than zero")
+
+        self.current: List[int] = [initial_level] * size
+        self.maximum: List[int] = [maximum_level] * size
+
+    def __len__(self) -> int:
+        return len(self.current)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={len(self.current)})"
+
+    def consume(self, amount: int) -> List[bool]:
+        """
+        Consume `amount` from every container that holds enough.
+
+        Containers with too little are left unchanged.
+
+        Returns:
+            List[bool]: per-container mask, True where the amount was consumed.
+
+        Raises:
+            operation error of the container type: if amount <= 0.
+        """
+        if amount <= 0:
+            raise self._operation_error(
+                "Consumption amount must be greater than zero"
+            )
+
+        current = self.current
+        mask = [level >= amount for level in current]
+        current[:] = [level - amount if ok else level
+                      for level, ok in zip(current, mask)]
+        return mask
+
+    def refill(self, amount: int) -> None:
+        """
+        Add `amount` to every container, capping each at its maximum.
+
+        Raises:
+            operation error of the container type: if amount <= 0.
+        """
+        if amount <= 0:
+            raise self._operation_error(
+                "Refill amount must be greater than zero"
+            )
+
+        current = self.current
+        current[:] = [level + amount if level + amount < maximum
+                      else maximum
+                      for level, maximum in zip(current, self.maximum)]
+
+    def refill_each(self, amounts: Sequence[int]) -> List[IntEnum]:
+        """
+        Refill every container by its own amount (amounts[i] for index i).
+
+        Returns:
+            List of refill statuses of the container type, one per index.
+
+        Raises:
+            ValueError: if len(amounts) differs from the number of containers.
+            operation error of the container type: if any amount <= 0
+                (no container is modified).
+        """
+        new_levels, statuses = _refill_batch(
+            self.current, amounts, self.maximum, self._operation_error,
+            self._now_full, self._still_not_full)
+        self.current[:] = new_levels
+        return statuses
+
+    def consume_at(self, index: int, amount: int) -> bool:
+        """
+        Consume `amount` from the container at `index` if it holds enough.
+
+        Per-index counterpart of consume(), with the semantics of
+        try_consume() of the single-container classes.
+
+        Returns:
+            bool: True if consumed, False if there was not enough (the level
+                  is not modified).
+
+        Raises:
+            operation error of the container type: if amount <= 0.
+            IndexError: if index is out of range.
+        """
+        if amount <= 0:
+            raise self._operation_error(
+                "Consumption amount must be greater than zero"
+            )
+
+        level = self.current[index]
+        if amount <= level:
+            self.current[index] = level - amount
+            return True
+        return False
+
+    def refill_at(self, index: int, amount: int) -> IntEnum:
+        """
+        Refill the container at `index`, capping it at its maximum.
+
+        Returns:
+            NOW_FULL or STILL_NOT_FULL status of the container type.
+
+        Raises:
+            operation error of the container type: if amount <= 0.
+            IndexError: if index is out of range.
+        """
+        if amount <= 0:
+            raise self._operation_error(
+                "Refill amount must be greater than zero"
+            )
+
+        new_level = self.current[index] + amount
+        maximum = self.maximum[index]
+        if new_level >= maximum:
+            self.current[index] = maximum
+            return self._now_full
+
+        self.current[index] = new_level
+        return self._still_not_full
+
+
+class WaterTankArray(_ContainerArray):
+    """Batch counterpart of WaterTank (levels in milliliters)."""
+
+    __slots__ = ()
+
+    _config_error = InvalidWaterTankConfigError
+    _operation_error = InvalidWaterOperationError
+    _now_full = WaterTankRefillStatus.NOW_FULL
+    _still_not_full = WaterTankRefillStatus.STILL_NOT_FULL
+
+
+class BeanContainerArray(_ContainerArray):
+    """Batch counterpart of BeanContainer (levels in grams)."""
+
+    __slots__ = ()
+
+    _config_error = InvalidBeanContainerConfigError
+    _operation_error = InvalidBeanOperationError
+    _now_full = BeanContainerRefillStatus.NOW_FULL
+    _still_not_full = BeanContainerRefillStatus.STILL_NOT_FULL
+
+
+def _refill_batch(
+    current_levels: Sequence[int],
+    amounts: Sequence[int],
+    maxima: Sequence[int],
+    operation_error: type,
+    now_full: IntEnum,
+    still_not_full: IntEnum,
+) -> Tuple[List[int], List[IntEnum]]:
+    """Shared body of refill_water_batch() and refill_beans_batch()."""
+    if not len(current_levels) == len(amounts) == len(maxima):
+        raise ValueError("current_levels, amounts and maxima must have "
+                         "the same length")
+
+    if any(amount <= 0 for amount in amounts):
+        raise operation_error("Refill amount must be greater than zero")
+
+    new_levels = [level + amount if level + amount < maximum else maximum
+                  for level, amount, maximum
+                  in zip(current_levels, amounts, maxima)]
+    statuses = [now_full if level == maximum else still_not_full
+                for level, maximum in zip(new_levels, maxima)]
+    return new_levels, statuses
+
+
+def refill_water_batch(
+    current_levels: Sequence[int],
+    amounts: Sequence[int],
+    maxima: Sequence[int],
+) -> Tuple[List[int], List[WaterTankRefillStatus]]:
+    """
+    Refill many water tanks at once, each by its own amount.
+
+    Same rules as WaterTank.refill() applied per index: the level is capped
+    at the maximum. The inputs are not modified.
+
+    Returns:
+        Tuple[List[int], List[WaterTankRefillStatus]]: new levels and the
+        refill status of every tank.
+
+    Raises:
+        ValueError: if the sequences differ in length.
+        InvalidWaterOperationError: if any amount <= 0 (nothing is
+            computed).
+    """
+    return _refill_batch(current_levels, amounts, maxima,
+                         InvalidWaterOperationError,
+                         WaterTankRefillStatus.NOW_FULL,
+                         WaterTankRefillStatus.STILL_NOT_FULL)
+
+
+def refill_beans_batch(
+    current_levels: Sequence[int],
+    amounts: Sequence[int],
+    maxima: Sequence[int],
+) -> Tuple[List[int], List[BeanContainerRefillStatus]]:
+    """
+    Refill many bean containers at once, each by its own amount.
+
+    Bean counterpart of refill_water_batch().
+
+    Raises:
+        ValueError: if the sequences differ in length.
+        InvalidBeanOperationError: if any amount <= 0.
+    """
+    return _refill_batch(current_levels, amounts, maxima,
+                         InvalidBeanOperationError,
+                         BeanContainerRefillStatus.NOW_FULL,
+                         BeanContainerRefillStatus.STILL_NOT_FULL)
@@ -0,0 +1,90 @@
+# src/coffee_machine/fast_sim.py
+from typing import Dict
+from src.coffee_machine.bean_container import BeanContainer
+from src.coffee_machine.coffee_recipe import CoffeeRecipe
+from src.coffee_machine.water_tank import WaterTank
+from src.coffee_machine.policies.brew_policy import (BrewDecision,
+                                                     DefaultBrewPolicy)
+from src.coffee_machine.policies.cleaning_policy import DefaultCleaningPolicy
+
+
+def simulate_brews(
+    n_brews: int,
+    recipe: CoffeeRecipe,
+    water_tank: WaterTank,
+    bean_container: BeanContainer,
+    brew_policy: DefaultBrewPolicy,
+    cleaning_policy: DefaultCleaningPolicy,
+    refill_water_ml: int = 0,
+    refill_beans_g: int = 0,
+) -> Dict[BrewDecision, int]:
+    """
+    Run n_brews brew attempts of one recipe and count the decisions.
+
+    Equivalent to driving a SimpleCoffeeMachine with an operator who, after
+    every attempt:
+      - refills water by refill_water_ml on OUT_OF_WATER (0 = never),
+      - refills beans by refill_beans_g on OUT_OF_BEANS (0 = never),
+      - cleans the machine on NEEDS_CLEANING, or when the cleaning policy
+        asks for IMMEDIATE cleaning after a brew.
+
+    The whole state lives in local ints, so no objects are touched inside
+    the loop; intended for policy tuning and benchmarks. The containers are
+    only read for their starting levels and are not modified. The
+    time-based cleaning rule is ignored (the simulation has no clock).
+
+    Returns:
+        Dict[BrewDecision, int]: number of attempts per decision.
+    """
+    if n_brews < 0:
+        raise ValueError("n_brews must be >= 0")
+    if refill_water_ml < 0 or refill_beans_g < 0:
+        raise ValueError("refill amounts must be >= 0")
+
+    water = water_tank.current_level
+    water_max = water_tank.maximum_level
+    beans = bean_container.current_level
+    beans_max = bean_container.maximum_level
+    water_ml = recipe.water_ml
+    beans_g = recipe.beans_g
+    clean_threshold = brew_policy.clean_threshold
+    immediate_threshold = cleaning_policy.immediate_threshold
+
+    ok = out_of_water = out_of_beans = needs_cleaning = forbidden = 0
+
+    if not water_ml and not beans_g:
+        if brew_policy.allow_recipe_with_no_requirements:
+            ok = n_brews
+            n_brews = 0
+        else:
+            forbidden = n_brews
+            n_brews = 0
+
+    dirty_count = 0
+    for _ in range(n_brews):
+        if water < water_ml:
+            out_of_water += 1
+            if refill_water_ml:
+                water = min(water + refill_water_ml, water_max)
+        elif beans < beans_g:
+            out_of_beans += 1
+            if refill_beans_g:
+                beans = min(beans + refill_beans_g, beans_max)
+        elif dirty_count >= clean_threshold:
+            needs_cleaning += 1
+            dirty_count = 0
+        else:
+            ok += 1
+            water -= water_ml
+            beans -= beans_g
+            dirty_count += 1
+            if dirty_count >= immediate_threshold:
+                dirty_count = 0
+
+    counts = dict.fromkeys(BrewDecision, 0)
+    counts[BrewDecision.OK] = ok
+    counts[BrewDecision.OUT_OF_WATER] = out_of_water
+    counts[BrewDecision.OUT_OF_BEANS] = out_of_beans
+    counts[BrewDecision.NEEDS_CLEANING] = needs_cleaning
+    counts[BrewDecision.RECIPE_FORBIDDEN] = forbidden
+    return counts
@@ -1,12 +1,12 @@
 # src/coffee_machine/policies/brew_policy.py
 from __future__ import annotations
-from enum import Enum, auto
+from enum import IntEnum, auto
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
+from typing import Tuple
 from src.coffee_machine.coffee_recipe import CoffeeRecipe
 
 
-class BrewDecision(Enum):
+class BrewDecision(IntEnum):
     OK = auto()
     OUT_OF_WATER = auto()
     OUT_OF_BEANS = auto()
@@ -15,12 +15,45 @@ class BrewDecision(Enum):
     ERROR = auto()
 
 
+# bit flags combined into an index of DefaultBrewPolicy._DECISIONS
+_FLAG_OUT_OF_WATER = 1
+_FLAG_OUT_OF_BEANS = 2
+_FLAG_NEEDS_CLEANING = 4
+_FLAG_NO_REQUIREMENTS = 8
+_FLAG_ALLOW_NO_REQUIREMENTS = 16
+
+
+def _build_decision_table() -> Tuple[BrewDecision, ...]:
+    """
+    Precompute the decision for every combination of check flags.
+
+    Priority of checks: recipe with no requirements, water, beans, cleaning.
+    """
+    table = []
+    for flags in range(32):
+        if flags & _FLAG_NO_REQUIREMENTS:
+            if flags & _FLAG_ALLOW_NO_REQUIREMENTS:
+                decision = BrewDecision.OK
+            else:
+                decision = BrewDecision.RECIPE_FORBIDDEN
+        elif flags & _FLAG_OUT_OF_WATER:
+            decision = BrewDecision.OUT_OF_WATER
+        elif flags & _FLAG_OUT_OF_BEANS:
+            decision = BrewDecision.OUT_OF_BEANS
+        elif flags & _FLAG_NEEDS_CLEANING:
+            decision = BrewDecision.NEEDS_CLEANING
+        else:
+            decision = BrewDecision.OK
+        table.append(decision)
+    return tuple(table)
+
+
 class BrewPolicy(ABC):
     """
     Abstract interface for brew decision policies.
 
     Implementations must not mutate resources; they only evaluate and return
-    a BrewDecision.
+    a BrewDecision. dirty_count is the number of brews since last cleaning.
     """
 
     @abstractmethod
@@ -29,7 +62,7 @@ class BrewPolicy(ABC):
         recipe: CoffeeRecipe,
         water_available_ml: int,
         beans_available_g: int,
-        maintenance_state: Optional[Dict] = None,
+        dirty_count: int = 0,
     ) -> BrewDecision:
         raise NotImplementedError
 
@@ -44,7 +77,9 @@ class DefaultBrewPolicy(BrewPolicy):
         water nor beans are allowed (default: False -> RECIPE_FORBIDDEN).
     """
 
-    def __init__(self, clean_threshold: int = 100, allow_recipe_with_no_requirements: bool = False):
+    _DECISIONS = _build_decision_table()
+
+    def __init__(self, clean_threshold: int = 100, allow_recipe_with_no_requirements: bool = False) -> None:
         if clean_threshold < 0:
             raise ValueError("clean_threshold must be >= 0")
         self.clean_threshold = clean_threshold
@@ -55,30 +90,16 @@ class DefaultBrewPolicy(BrewPolicy):
         recipe: CoffeeRecipe,
         water_available_ml: int,
         beans_available_g: int,
-        maintenance_state: Optional[Dict] = None,
+        dirty_count: int = 0,
     ) -> BrewDecision:
-        # safety: normalize maintenance_state
-        maintenance_state = maintenance_state or {}
-        dirty_count = int(maintenance_state.get("dirty_count", 0))
-
-        # 1. sanity on recipe methods
-        requires_water = recipe.requires_water()
-        requires_beans = recipe.requires_beans()
-
-        # 2. recipe that requires nothing -> either allow or treat as forbidden
-        if not requires_water and not requires_beans:
-            return BrewDecision.OK if self.allow_recipe_with_no_requirements else BrewDecision.RECIPE_FORBIDDEN
-
-        # 3. resource checks (water first)
-        if requires_water and water_available_ml < recipe.water_ml:
-            return BrewDecision.OUT_OF_WATER
-
-        if requires_beans and beans_available_g < recipe.beans_g:
-            return BrewDecision.OUT_OF_BEANS
-
-        # 4. cleaning check
-        if dirty_count >= self.clean_threshold:
-            return BrewDecision.NEEDS_CLEANING
-
-        # 5. default: OK
-        return BrewDecision.OK
+        # every check is evaluated and folded into a single table index;
+        # a recipe needing no water has water_ml == 0, so the level check
+        # cannot fire for it (same for beans)
+        index = (
+            (water_available_ml < recipe.water_ml)
+            | (beans_available_g < recipe.beans_g) << 1
+            | (dirty_count >= self.clean_threshold) << 2
+            | (not (recipe.requires_water() or recipe.requires_beans())) << 3
+            | bool(self.allow_recipe_with_no_requirements) << 4
+        )
+        return self._DECISIONS[index]
@@ -1,12 +1,13 @@
 # src/coffee_machine/policies/cleaning_policy.py
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import Optional
-from datetime import datetime, timedelta
+from datetime import timedelta
+import time
 
 
-class CleaningAction(Enum):
+class CleaningAction(IntEnum):
     NO_ACTION = auto()
     SCHEDULE = auto()   # schedule cleaning after current brew cycle
     IMMEDIATE = auto()  # require immediate cleaning before next brew
@@ -17,10 +18,11 @@ class CleaningPolicy(ABC):
     Abstract interface for cleaning policies.
 
     Implementations must be pure functions: evaluate state and return CleaningAction.
+    last_cleaned_ts is a time.monotonic_ns() reading (or None if never cleaned).
     """
 
     @abstractmethod
-    def evaluate(self, dirty_count: int, last_cleaned_ts: Optional[datetime]) -> CleaningAction:
+    def evaluate(self, dirty_count: int, last_cleaned_ts: Optional[int]) -> CleaningAction:
         raise NotImplementedError
 
 
@@ -41,20 +43,30 @@ class DefaultCleaningPolicy(CleaningPolicy):
         schedule_threshold: int = 80,
         immediate_threshold: int = 120,
         max_time_between_cleans: Optional[timedelta] = None,
-    ):
+    ) -> None:
         if not (0 <= schedule_threshold <= immediate_threshold):
             raise ValueError("0 <= schedule_threshold <= immediate_threshold required")
         self.schedule_threshold = int(schedule_threshold)
         self.immediate_threshold = int(immediate_threshold)
         self.max_time_between_cleans = max_time_between_cleans
 
-    def evaluate(self, dirty_count: int, last_cleaned_ts: Optional[datetime]) -> CleaningAction:
-        # normalize inputs
-        dirty_count = int(dirty_count or 0)
+    @property
+    def max_time_between_cleans(self) -> Optional[timedelta]:
+        return self._max_time_between_cleans
 
+    @max_time_between_cleans.setter
+    def max_time_between_cleans(self, value: Optional[timedelta]) -> None:
+        # the limit is compared in monotonic_ns units; keep both in sync
+        self._max_time_between_cleans = value
+        self._max_ns = (
+            value // timedelta(microseconds=1) * 1000
+            if value is not None else None
+        )
+
+    def evaluate(self, dirty_count: int, last_cleaned_ts: Optional[int]) -> CleaningAction:
         # time-based immediate check
-        if self.max_time_between_cleans is not None and last_cleaned_ts is not None:
-            if datetime.utcnow() - last_cleaned_ts >= self.max_time_between_cleans:
+        if self._max_ns is not None and last_cleaned_ts is not None:
+            if time.monotonic_ns() - last_cleaned_ts >= self._max_ns:
                 return CleaningAction.IMMEDIATE
 
         # count-based logic
@@ -1,11 +1,11 @@
 # src/coffee_machine/policies/refill_policy.py
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import Tuple
 
 
-class RefillResult(Enum):
+class RefillResult(IntEnum):
     NOW_FULL = auto()
     STILL_NOT_FULL = auto()
     OVERFLOW_ERROR = auto()  # used by strict policy to indicate error
@@ -28,7 +28,7 @@ class CapRefillPolicy(RefillPolicy):
     Default, forgiving policy: cap to maximum when refill would overflow.
     """
 
-    def on_refill(self, current_level: int, refill_amount: int, maximum: int):
+    def on_refill(self, current_level: int, refill_amount: int, maximum: int) -> Tuple[int, RefillResult]:
         if refill_amount <= 0:
             raise ValueError("refill_amount must be > 0")
 
@@ -43,7 +43,7 @@ class StrictRefillPolicy(RefillPolicy):
     Strict policy: raising/returning overflow error instead of capping.
     """
 
-    def on_refill(self, current_level: int, refill_amount: int, maximum: int):
+    def on_refill(self, current_level: int, refill_amount: int, maximum: int) -> Tuple[int, RefillResult]:
         if refill_amount <= 0:
             raise ValueError("refill_amount must be > 0")
 
@@ -1,4 +1,6 @@
-from enum import Enum, auto
+from enum import IntEnum, auto
+from typing import NoReturn, final
+from src.coffee_machine._reservoir import _Reservoir
 from src.errors import (
     InvalidWaterTankConfigError,
     InvalidWaterOperationError,
@@ -6,7 +8,7 @@ from src.errors import (
 )
 
 
-class WaterTankRefillStatus(Enum):
+class WaterTankRefillStatus(IntEnum):
     """
     Result status returned by the WaterTank.refill operation.
     """
@@ -18,7 +20,12 @@ class WaterTankRefillStatus(Enum):
     """Tank is still not full after refill."""
 
 
-class WaterTank:
+_NOW_FULL = WaterTankRefillStatus.NOW_FULL
+_STILL_NOT_FULL = WaterTankRefillStatus.STILL_NOT_FULL
+
+
+@final
+class WaterTank(_Reservoir):
     """
     Domain model representing a water reservoir for a coffee machine.
 
@@ -29,11 +36,16 @@ class WaterTank:
 
     All water volumes are expressed in milliliters (ml).
 
+    The class is final and its instance layout is fixed by __slots__; the
+    level slots are private and only the mutating methods write them.
+
     Invariants guaranteed by this class:
     - 0 <= current_level <= maximum_level
     - maximum_level > 0
     """
 
+    __slots__ = ()
+
     def __init__(self, maximum_level: int, initial_level: int) -> None:
         """
         Create a new WaterTank instance.
@@ -51,6 +63,24 @@ class WaterTank:
                 - If initial_level is negative.
                 - If initial_level exceeds maximum_level.
         """
+        if maximum_level <= 0 or not 0 <= initial_level <= maximum_level:
+            self._raise_config_error(maximum_level, initial_level)
+
+        self._maximum_level = maximum_level
+        self._current_level = initial_level
+        # fulfillment_ratio cache, refreshed by every mutating method
+        self._ratio = initial_level / maximum_level
+        # __repr__ cache, built on first use and reset on every mutation
+        self._repr = None
+
+    @staticmethod
+    def _raise_config_error(maximum_level: int,
+                            initial_level: int) -> NoReturn:
+        """
+        Raise the error describing why the constructor arguments are invalid.
+
+        Kept out of __init__ so the valid path performs a single check.
+        """
         if maximum_level <= 0:
             raise InvalidWaterTankConfigError(
                 "maximum_level should be greater than zero"
@@ -61,55 +91,9 @@ class WaterTank:
                 "Initial level cannot be less than zero"
             )
 
-        if initial_level > maximum_level:
-            raise InvalidWaterTankConfigError(
-                "Initial level should not be greater than maximum level"
-            )
-
-        self._maximum_level = maximum_level
-        self._current_level = initial_level
-
-    @property
-    def missing_capacity(self) -> int:
-        """
-        Return the amount of water (in ml) missing to reach full capacity.
-
-        Returns:
-            int: Difference between maximum level and current level.
-        """
-        return self._maximum_level - self._current_level
-
-    @property
-    def fulfillment_ratio(self) -> float:
-        """
-        Return the current fill ratio of the tank.
-
-        The value is expressed as a float in the range [0.0, 1.0].
-
-        Returns:
-            float: Current_level divided by maximum_level.
-        """
-        return self._current_level / self._maximum_level
-
-    @property
-    def current_level(self) -> int:
-        """
-        Return the current water level in milliliters.
-
-        Returns:
-            int: Current water level.
-        """
-        return self._current_level
-
-    @property
-    def maximum_level(self) -> int:
-        """
-        Return the maximum water capacity of the tank in milliliters.
-
-        Returns:
-            int: Maximum tank capacity.
-        """
-        return self._maximum_level
+        raise InvalidWaterTankConfigError(
+            "Initial level should not be greater than maximum level"
+        )
 
     def __repr__(self) -> str:
         """
@@ -119,10 +103,12 @@ class WaterTank:
             str: Representation containing class name, maximum level
                  and current level.
         """
-        return (
-            f"{self.__class__.__name__}(max={self._maximum_level},"
-            f"current={self._current_level})"
-        )
+        if self._repr is None:
+            self._repr = (
+                f"{self.__class__.__name__}(max={self._maximum_level},"
+                f"current={self._current_level})"
+            )
+        return self._repr
 
     def consume_water(self, use_level: int) -> None:
         """
@@ -148,8 +134,10 @@ class WaterTank:
                 "Water usage must be greater than zero"
             )
 
-        if self._current_level - use_level >= 0:
+        if use_level <= self._current_level:
             self._current_level -= use_level
+            self._ratio = self._current_level / self._maximum_level
+            self._repr = None
             return
 
         raise NotEnoughWaterError
@@ -183,26 +171,11 @@ class WaterTank:
 
         if new_level >= self._maximum_level:
             self._current_level = self._maximum_level
-            return WaterTankRefillStatus.NOW_FULL
-
-        self._current_level += refill_level
-        return WaterTankRefillStatus.STILL_NOT_FULL
-
-    def is_empty(self) -> bool:
-        """
-        Check whether the tank is empty.
-
-        Returns:
-            bool: True if the current water level is zero, False otherwise.
-        """
-        return self._current_level == 0
-
-    def is_full(self) -> bool:
-        """
-        Check whether the tank is full.
-
-        Returns:
-            bool: True if the current water level equals the maximum level,
-                  False otherwise.
-        """
-        return self._current_level == self._maximum_level
+            self._ratio = 1.0
+            self._repr = None
+            return _NOW_FULL
+
+        self._current_level = new_level
+        self._ratio = new_level / self._maximum_level
+        self._repr = None
+        return _STILL_NOT_FULL
@@ -9,7 +9,7 @@ def test_brew_policy_ok_when_resources_sufficient():
     decision = policy.can_brew(recipe,
                                water_available_ml=100,
                                beans_available_g=100,
-                               maintenance_state={"dirty_count": 0})
+                               dirty_count=0)
 
     assert decision is BrewDecision.OK
 
@@ -19,8 +19,7 @@ def test_brew_policy_out_of_water():
     recipe = CoffeeRecipe("espresso", 50, 8)
     decision = policy.can_brew(recipe,
                                water_available_ml=40,
-                               beans_available_g=100,
-                               maintenance_state={})
+                               beans_available_g=100)
 
     assert decision is BrewDecision.OUT_OF_WATER
 
@@ -30,8 +29,7 @@ def test_brew_policy_out_of_beans():
     recipe = CoffeeRecipe("espresso", 30, 10)
     decision = policy.can_brew(recipe,
                                water_available_ml=100,
-                               beans_available_g=9,
-                               maintenance_state={})
+                               beans_available_g=9)
 
     assert decision is BrewDecision.OUT_OF_BEANS
 
@@ -41,6 +39,49 @@ def test_brew_policy_needs_cleaning_when_dirty_count_exceeded():
     recipe = CoffeeRecipe("espresso", 10, 1)
     decision = policy.can_brew(recipe, water_available_ml=100,
                                beans_available_g=100,
-                               maintenance_state={"dirty_count": 2})
+                               dirty_count=2)
 
     assert decision is BrewDecision.NEEDS_CLEANING
+
+
+def test_brew_policy_recipe_without_requirements_forbidden():
+    policy = DefaultBrewPolicy(clean_threshold=10)
+    recipe = CoffeeRecipe("nothing", 0, 0)
+    decision = policy.can_brew(recipe,
+                               water_available_ml=100,
+                               beans_available_g=100)
+
+    assert decision is BrewDecision.RECIPE_FORBIDDEN
+
+
+def test_brew_policy_recipe_without_requirements_allowed():
+    policy = DefaultBrewPolicy(clean_threshold=1,
+                               allow_recipe_with_no_requirements=True)
+    recipe = CoffeeRecipe("nothing", 0, 0)
+    decision = policy.can_brew(recipe,
+                               water_available_ml=0,
+                               beans_available_g=0,
+                               dirty_count=5)
+
+    assert decision is BrewDecision.OK
+
+
+def test_brew_policy_water_checked_before_beans_and_cleaning():
+    policy = DefaultBrewPolicy(clean_threshold=1)
+    recipe = CoffeeRecipe("espresso", 30, 8)
+    decision = policy.can_brew(recipe,
+                               water_available_ml=10,
+                               beans_available_g=1,
+                               dirty_count=5)
+
+    assert decision is BrewDecision.OUT_OF_WATER
+
+
+def test_brew_policy_accepts_any_truthy_allow_flag():
+    recipe = CoffeeRecipe("nothing", 0, 0)
+    for flag in (2, "yes"):
+        policy = DefaultBrewPolicy(allow_recipe_with_no_requirements=flag)
+        assert policy.can_brew(recipe, 0, 0) is BrewDecision.OK
+
+    policy.allow_recipe_with_no_requirements = ""
+    assert policy.can_brew(recipe, 0, 0) is BrewDecision.RECIPE_FORBIDDEN
@@ -1,5 +1,6 @@
 # tests/unit/policies/test_cleaning_policy.py
-from datetime import datetime, timedelta
+from datetime import timedelta
+import time
 import pytest
 
 from src.coffee_machine.policies.cleaning_policy import (
@@ -28,10 +29,29 @@ def test_immediate_when_equal_or_above_immediate_threshold():
 
 def test_time_based_immediate():
     policy = DefaultCleaningPolicy(schedule_threshold=5, immediate_threshold=10, max_time_between_cleans=timedelta(days=7))
-    old_ts = datetime.utcnow() - timedelta(days=8)
+    old_ts = time.monotonic_ns() - timedelta(days=8) // timedelta(microseconds=1) * 1000
     assert policy.evaluate(dirty_count=0, last_cleaned_ts=old_ts) is CleaningAction.IMMEDIATE
 
 
 def test_invalid_thresholds_raise():
     with pytest.raises(ValueError):
         DefaultCleaningPolicy(schedule_threshold=10, immediate_threshold=5)
+
+
+def test_time_based_no_action_when_recently_cleaned():
+    policy = DefaultCleaningPolicy(schedule_threshold=5, immediate_threshold=10, max_time_between_cleans=timedelta(days=7))
+    recent_ts = time.monotonic_ns() - timedelta(days=1) // timedelta(microseconds=1) * 1000
+    assert policy.evaluate(dirty_count=0, last_cleaned_ts=recent_ts) is CleaningAction.NO_ACTION
+
+
+def test_max_time_between_cleans_can_be_changed_after_construction():
+    policy = DefaultCleaningPolicy(schedule_threshold=5, immediate_threshold=10)
+    old_ts = time.monotonic_ns() - timedelta(days=8) // timedelta(microseconds=1) * 1000
+    assert policy.evaluate(dirty_count=0, last_cleaned_ts=old_ts) is CleaningAction.NO_ACTION
+
+    policy.max_time_between_cleans = timedelta(days=7)
+    assert policy.max_time_between_cleans == timedelta(days=7)
+    assert policy.evaluate(dirty_count=0, last_cleaned_ts=old_ts) is CleaningAction.IMMEDIATE
+
+    policy.max_time_between_cleans = None
+    assert policy.evaluate(dirty_count=0, last_cleaned_ts=old_ts) is CleaningAction.NO_ACTION
@@ -71,6 +71,24 @@ class TestBeanContainer:
         with pytest.raises(InvalidBeanOperationError):
             container.consume_beans(invalid_amount)
 
+    def test_try_consume(self):
+        container = BeanContainer(500, 200)
+
+        assert container.try_consume(150) is True
+        assert container.current_level == 50
+
+    def test_try_consume_not_enough_returns_false_and_state_unchanged(self):
+        container = BeanContainer(500, 50)
+
+        assert container.try_consume(100) is False
+        assert container.current_level == 50
+
+    @pytest.mark.parametrize("invalid_amount", [0, -10])
+    def test_try_consume_invalid_amount_raises(self, invalid_amount):
+        container = BeanContainer(500, 200)
+        with pytest.raises(InvalidBeanOperationError):
+            container.try_consume(invalid_amount)
+
     # parametryzacja testu Refill, jeden test zamiast 3
     @pytest.mark.parametrize(
         "maximum_level, "
@@ -161,3 +179,47 @@ class TestBeanContainer:
     def test_fulfillment_ratio_edges(self):
         assert BeanContainer(100, 0).fulfillment_ratio == pytest.approx(0.0)
         assert BeanContainer(100, 100).fulfillment_ratio == pytest.approx(1.0)
+
+    def test_has_no_instance_dict(self):
+        container = BeanContainer(500, 200)
+        with pytest.raises(AttributeError):
+            container.__dict__
+        with pytest.raises(AttributeError):
+            container.unknown_attribute = 1
+
+    @pytest.mark.parametrize("attribute",
+                             ["current_level", "maximum_level"])
+    def test_levels_are_read_only(self, attribute):
+        container = BeanContainer(500, 200)
+        with pytest.raises(AttributeError):
+            setattr(container, attribute, 900)
+        assert container.current_level == 200
+        assert container.maximum_level == 500
+        assert container.fulfillment_ratio == pytest.approx(0.4)
+
+    def test_class_is_final(self):
+        assert getattr(BeanContainer, "__final__", False) is True
+
+    def test_fulfillment_ratio_follows_mutations(self):
+        container = BeanContainer(500, 200)
+        container.consume_beans(100)
+        assert container.fulfillment_ratio == pytest.approx(0.2)
+
+        container.refill(150)
+        assert container.fulfillment_ratio == pytest.approx(0.5)
+
+        container.refill(1000)
+        assert container.fulfillment_ratio == pytest.approx(1.0)
+
+        container.try_consume(400)
+        assert container.fulfillment_ratio == pytest.approx(0.2)
+
+    def test_repr_follows_mutations(self):
+        container = BeanContainer(500, 200)
+        assert repr(container) == "BeanContainer(max=500g, current=200g)"
+
+        container.consume_beans(50)
+        assert repr(container) == "BeanContainer(max=500g, current=150g)"
+
+        container.refill(1000)
+        assert repr(container) == "BeanContainer(max=500g, current=500g)"
@@ -0,0 +1,202 @@
+from src.coffee_machine.coffee_machine import (SimpleCoffeeMachine,
+                                               MachineState)
+from src.coffee_machine.coffee_recipe import CoffeeRecipe
+from src.coffee_machine.water_tank import WaterTank
+from src.coffee_machine.bean_container import BeanContainer
+from src.coffee_machine.policies.brew_policy import (DefaultBrewPolicy,
+                                                     BrewDecision)
+from src.coffee_machine.policies.cleaning_policy import (DefaultCleaningPolicy,
+                                                         CleaningAction)
+from src.coffee_machine.policies.refill_policy import CapRefillPolicy
+from datetime import timedelta
+import time
+import pytest
+
+
+def make_machine(water=500, beans=200, clean_threshold=10,
+                 schedule_threshold=3, immediate_threshold=6):
+    return SimpleCoffeeMachine(
+        WaterTank(1000, water),
+        BeanContainer(500, beans),
+        DefaultBrewPolicy(clean_threshold=clean_threshold),
+        DefaultCleaningPolicy(schedule_threshold=schedule_threshold,
+                              immediate_threshold=immediate_threshold),
+        CapRefillPolicy(),
+    )
+
+
+class AlwaysOutOfBeansPolicy(DefaultBrewPolicy):
+    def can_brew(self, recipe, water_available_ml, beans_available_g,
+                 dirty_count=0):
+        return BrewDecision.OUT_OF_BEANS
+
+
+class AlwaysScheduleCleaningPolicy(DefaultCleaningPolicy):
+    def evaluate(self, dirty_count, last_cleaned_ts):
+        return CleaningAction.SCHEDULE
+
+
+@pytest.fixture
+def espresso() -> CoffeeRecipe:
+    return CoffeeRecipe("espresso", 30, 8)
+
+
+class TestSimpleCoffeeMachine:
+    def test_initial_state_is_idle(self):
+        machine = make_machine()
+        assert machine.state is MachineState.IDLE
+        assert machine.active_recipe is None
+        assert machine.dirty_count == 0
+
+    def test_brew_without_recipe_raises(self):
+        machine = make_machine()
+        with pytest.raises(RuntimeError):
+            machine.brew()
+
+    def test_brew_consumes_resources(self, espresso):
+        machine = make_machine()
+        machine.select_recipe(espresso)
+
+        assert machine.brew() is BrewDecision.OK
+        assert machine.water_tank.current_level == 470
+        assert machine.bean_container.current_level == 192
+        assert machine.dirty_count == 1
+        assert machine.state is MachineState.IDLE
+
+    @pytest.mark.parametrize(
+        "water, beans, expected_decision, expected_state",
+        [
+            (10, 200, BrewDecision.OUT_OF_WATER, MachineState.OUT_OF_WATER),
+            (500, 5, BrewDecision.OUT_OF_BEANS, MachineState.OUT_OF_BEANS),
+        ],
+        ids=["out_of_water", "out_of_beans"]
+    )
+    def test_brew_refused_sets_state(self, espresso, water, beans,
+                                     expected_decision, expected_state):
+        machine = make_machine(water=water, beans=beans)
+        machine.select_recipe(espresso)
+
+        assert machine.brew() is expected_decision
+        assert machine.state is expected_state
+        assert machine.water_tank.current_level == water
+        assert machine.bean_container.current_level == beans
+
+    def test_schedule_then_immediate_cleaning(self, espresso):
+        machine = make_machine(schedule_threshold=2, immediate_threshold=3)
+        machine.select_recipe(espresso)
+
+        machine.brew()
+        assert machine.cleaning_scheduled is False
+
+        machine.brew()
+        assert machine.cleaning_scheduled is True
+        assert machine.state is MachineState.IDLE
+
+        machine.brew()
+        assert machine.state is MachineState.NEEDS_CLEANING
+
+    def test_brew_policy_needs_cleaning(self, espresso):
+        machine = make_machine(clean_threshold=1)
+        machine.select_recipe(espresso)
+
+        assert machine.brew() is BrewDecision.OK
+        assert machine.brew() is BrewDecision.NEEDS_CLEANING
+        assert machine.state is MachineState.NEEDS_CLEANING
+
+    def test_clean_resets_maintenance(self, espresso):
+        machine = make_machine(schedule_threshold=1, immediate_threshold=2)
+        machine.select_recipe(espresso)
+        machine.brew()
+        machine.brew()
+
+        machine.clean()
+
+        assert machine.dirty_count == 0
+        assert machine.last_cleaned_ts is not None
+        assert machine.last_cleaned_at is not None
+        assert machine.cleaning_scheduled is False
+        assert machine.state is MachineState.IDLE
+
+    def test_last_cleaned_at_is_fixed_per_cleaning(self):
+        machine = make_machine()
+        assert machine.last_cleaned_at is None
+
+        machine.clean()
+        cleaned_at = machine.last_cleaned_at
+        time.sleep(0.001)
+
+        assert machine.last_cleaned_at == cleaned_at
+
+    def test_refill_delegates_to_containers(self):
+        machine = make_machine(water=100, beans=100)
+        machine.refill_water(50)
+        machine.refill_beans(50)
+
+        assert machine.water_tank.current_level == 150
+        assert machine.bean_container.current_level == 150
+
+    def test_custom_brew_policy_is_consulted(self, espresso):
+        machine = make_machine()
+        machine.brew_policy = AlwaysOutOfBeansPolicy()
+        machine.select_recipe(espresso)
+
+        assert machine.brew() is BrewDecision.OUT_OF_BEANS
+        assert machine.state is MachineState.OUT_OF_BEANS
+
+    def test_custom_cleaning_policy_is_consulted(self, espresso):
+        machine = make_machine()
+        machine.cleaning_policy = AlwaysScheduleCleaningPolicy()
+        machine.select_recipe(espresso)
+
+        assert machine.brew() is BrewDecision.OK
+        assert machine.cleaning_scheduled is True
+
+    @pytest.mark.parametrize("allow, expected", [
+        (False, BrewDecision.RECIPE_FORBIDDEN),
+        (True, BrewDecision.OK),
+    ], ids=["forbidden", "allowed"])
+    def test_recipe_without_requirements(self, allow, expected):
+        machine = make_machine()
+        machine.brew_policy = DefaultBrewPolicy(
+            allow_recipe_with_no_requirements=allow)
+        machine.select_recipe(CoffeeRecipe("nothing", 0, 0))
+
+        assert machine.brew() is expected
+
+    def test_time_based_cleaning(self, espresso):
+        machine = make_machine()
+        machine.cleaning_policy = DefaultCleaningPolicy(
+            schedule_threshold=5, immediate_threshold=10,
+            max_time_between_cleans=timedelta(days=7))
+        machine.select_recipe(espresso)
+        machine.clean()
+        eight_days_ns = timedelta(days=8) // timedelta(microseconds=1) * 1000
+        machine.last_cleaned_ts = time.monotonic_ns() - eight_days_ns
+
+        assert machine.brew() is BrewDecision.OK
+        assert machine.state is MachineState.NEEDS_CLEANING
+
+    def test_time_limit_set_after_construction_is_used(self, espresso):
+        machine = make_machine()
+        machine.select_recipe(espresso)
+        machine.clean()
+        eight_days_ns = timedelta(days=8) // timedelta(microseconds=1) * 1000
+        machine.last_cleaned_ts = time.monotonic_ns() - eight_days_ns
+
+        machine.cleaning_policy.max_time_between_cleans = timedelta(days=7)
+
+        assert machine.brew() is BrewDecision.OK
+        assert machine.state is MachineState.NEEDS_CLEANING
+
+    @pytest.mark.parametrize("decision, state", [
+        (BrewDecision.OK, MachineState.IDLE),
+        (BrewDecision.OUT_OF_WATER, MachineState.OUT_OF_WATER),
+        (BrewDecision.OUT_OF_BEANS, MachineState.OUT_OF_BEANS),
+        (BrewDecision.RECIPE_FORBIDDEN, MachineState.RECIPE_FORBIDDEN),
+        (BrewDecision.NEEDS_CLEANING, MachineState.NEEDS_CLEANING),
+        (BrewDecision.ERROR, MachineState.ERROR),
+    ])
+    def test_machine_state_values_mirror_brew_decision(self, decision,
+                                                       state):
+        assert state == decision
+        assert len(MachineState) == len(BrewDecision)
@@ -1,8 +1,10 @@
 from src.coffee_machine.coffee_recipe import (CoffeeRecipe,
-                                              CoffeeRecipeGrindLevel)
+                                              CoffeeRecipeGrindLevel,
+                                              MAX_WATER_ML)
 from src.errors import InvalidRecipeError
 import pytest
-from dataclasses import FrozenInstanceError
+from dataclasses import (FrozenInstanceError, asdict, astuple, fields,
+                         replace)
 
 
 @pytest.fixture
@@ -100,3 +102,79 @@ class TestCoffeeRecipe:
 
         # different when a field differs
         assert coffee1 != coffee3
+
+    def test_unchecked_equals_validated_recipe(self):
+        checked = CoffeeRecipe("espresso", 30, 8,
+                               grind=CoffeeRecipeGrindLevel.FINE)
+        unchecked = CoffeeRecipe.unchecked("espresso", 30, 8,
+                                           grind=CoffeeRecipeGrindLevel.FINE)
+
+        assert unchecked == checked
+        assert hash(unchecked) == hash(checked)
+        assert unchecked.requires_water() is True
+        assert unchecked.requires_beans() is True
+        assert unchecked.as_dict() == checked.as_dict()
+
+    def test_unchecked_skips_validation(self):
+        recipe = CoffeeRecipe.unchecked("x", MAX_WATER_ML + 1, 0)
+
+        assert recipe.water_ml == MAX_WATER_ML + 1
+        assert recipe.requires_beans() is False
+
+    def test_repr_of_unchecked_matches_validated(self):
+        checked = CoffeeRecipe("reprtest", 45, 7)
+        unchecked = CoffeeRecipe.unchecked("reprtest", 45, 7)
+
+        assert repr(unchecked) == repr(checked)
+        assert repr(checked) == ("CoffeeRecipe(name='reprtest', water_ml=45, "
+                                 "beans_g=7, grind=None)")
+
+    def test_get_or_create_returns_canonical_instance(self):
+        first = CoffeeRecipe.get_or_create("interned", 30, 8,
+                                           CoffeeRecipeGrindLevel.FINE)
+        second = CoffeeRecipe.get_or_create("interned", 30, 8,
+                                            CoffeeRecipeGrindLevel.FINE)
+        other = CoffeeRecipe.get_or_create("interned", 40, 8,
+                                           CoffeeRecipeGrindLevel.FINE)
+
+        assert first is second
+        assert first is not other
+        assert first == CoffeeRecipe("interned", 30, 8,
+                                     CoffeeRecipeGrindLevel.FINE)
+
+    def test_get_or_create_validates(self):
+        with pytest.raises(InvalidRecipeError):
+            CoffeeRecipe.get_or_create("bad", -1, 8)
+
+    def test_equality_with_other_types(self, coffee):
+        assert coffee == coffee
+        assert coffee != ("espresso", 30, 8, None)
+
+    def test_dataclass_helpers_see_only_public_fields(self):
+        recipe = CoffeeRecipe("espresso", 30, 8,
+                              grind=CoffeeRecipeGrindLevel.FINE)
+
+        assert [f.name for f in fields(recipe)] == ["name", "water_ml",
+                                                    "beans_g", "grind"]
+        assert asdict(recipe) == {"name": "espresso", "water_ml": 30,
+                                  "beans_g": 8,
+                                  "grind": CoffeeRecipeGrindLevel.FINE}
+        assert astuple(recipe) == ("espresso", 30, 8,
+                                   CoffeeRecipeGrindLevel.FINE)
+        assert replace(recipe, water_ml=0).requires_water() is False
+
+    def test_get_or_create_validates_regardless_of_cache(self):
+        canonical = CoffeeRecipe.get_or_create("cached", 30, 8)
+
+        with pytest.raises(InvalidRecipeError):
+            CoffeeRecipe.get_or_create("cached", 30.0, 8)
+        with pytest.raises(InvalidRecipeError):
+            CoffeeRecipe.get_or_create("cached", 30, 8.0)
+        with pytest.raises(InvalidRecipeError):
+            CoffeeRecipe.get_or_create(["cached"], 30, 8)
+
+        from_int = CoffeeRecipe.get_or_create("flag", 1, 8)
+        from_bool = CoffeeRecipe.get_or_create("flag", True, 8)
+        assert from_bool is not from_int
+        assert from_bool.water_ml is True
+        assert CoffeeRecipe.get_or_create("cached", 30, 8) is canonical
@@ -0,0 +1,170 @@
+from src.errors import (InvalidBeanContainerConfigError,
+                        InvalidBeanOperationError,
+                        InvalidWaterTankConfigError,
+                        InvalidWaterOperationError)
+from src.coffee_machine.container_array import (BeanContainerArray,
+                                                WaterTankArray,
+                                                refill_beans_batch,
+                                                refill_water_batch)
+from src.coffee_machine.bean_container import BeanContainerRefillStatus
+from src.coffee_machine.water_tank import WaterTankRefillStatus
+import pytest
+
+
+class TestContainerArray:
+    def test_initialization(self):
+        tanks = WaterTankArray(500, 200, 3)
+        assert len(tanks) == 3
+        assert tanks.current == [200, 200, 200]
+        assert tanks.maximum == [500, 500, 500]
+
+    @pytest.mark.parametrize(
+        "cls, error",
+        [
+            (WaterTankArray, InvalidWaterTankConfigError),
+            (BeanContainerArray, InvalidBeanContainerConfigError),
+        ],
+        ids=["water", "beans"]
+    )
+    @pytest.mark.parametrize(
+        "maximum, initial, size",
+        [
+            (0, 0, 3),
+            (100, -1, 3),
+            (100, 150, 3),
+            (100, 50, -1),
+        ],
+        ids=[
+            "maximum_level_zero",
+            "initial_level_negative",
+            "initial_gt_maximum",
+            "size_negative",
+        ]
+    )
+    def test_constructor_invalid_values(self, cls, error,
+                                        maximum, initial, size):
+        with pytest.raises(error):
+            cls(maximum, initial, size)
+
+    def test_consume_only_where_enough(self):
+        beans = BeanContainerArray(500, 20, 3)
+        beans.current[1] = 5
+
+        mask = beans.consume(10)
+
+        assert mask == [True, False, True]
+        assert beans.current == [10, 5, 10]
+
+    def test_refill_caps_at_maximum(self):
+        tanks = WaterTankArray(500, 450, 2)
+        tanks.current[1] = 100
+
+        tanks.refill(100)
+
+        assert tanks.current == [500, 200]
+
+    @pytest.mark.parametrize(
+        "cls, error",
+        [
+            (WaterTankArray, InvalidWaterOperationError),
+            (BeanContainerArray, InvalidBeanOperationError),
+        ],
+        ids=["water", "beans"]
+    )
+    @pytest.mark.parametrize("invalid_amount", [0, -10])
+    def test_invalid_amount_raises(self, cls, error, invalid_amount):
+        containers = cls(500, 200, 2)
+        with pytest.raises(error):
+            containers.consume(invalid_amount)
+        with pytest.raises(error):
+            containers.refill(invalid_amount)
+        assert containers.current == [200, 200]
+
+    def test_consume_at_single_index(self):
+        tanks = WaterTankArray(500, 200, 3)
+
+        assert tanks.consume_at(1, 150) is True
+        assert tanks.consume_at(1, 100) is False
+        assert tanks.current == [200, 50, 200]
+
+    def test_refill_at_single_index(self):
+        beans = BeanContainerArray(100, 50, 2)
+
+        assert beans.refill_at(0, 20) is \
+            BeanContainerRefillStatus.STILL_NOT_FULL
+        assert beans.refill_at(1, 80) is BeanContainerRefillStatus.NOW_FULL
+        assert beans.current == [70, 100]
+
+    def test_refill_each(self):
+        tanks = WaterTankArray(500, 400, 3)
+
+        statuses = tanks.refill_each([50, 100, 200])
+
+        assert tanks.current == [450, 500, 500]
+        assert statuses == [WaterTankRefillStatus.STILL_NOT_FULL,
+                            WaterTankRefillStatus.NOW_FULL,
+                            WaterTankRefillStatus.NOW_FULL]
+
+    def test_refill_each_invalid_amount_keeps_levels(self):
+        tanks = WaterTankArray(500, 400, 2)
+        with pytest.raises(InvalidWaterOperationError):
+            tanks.refill_each([50, -1])
+        assert tanks.current == [400, 400]
+
+    def test_operations_update_current_in_place(self):
+        tanks = WaterTankArray(500, 200, 2)
+        view = tanks.current
+
+        tanks.consume(50)
+        assert view is tanks.current
+        assert view == [150, 150]
+
+        tanks.refill(400)
+        assert view is tanks.current
+        assert view == [500, 500]
+
+        tanks.consume_at(0, 100)
+        tanks.refill_at(0, 50)
+        assert view is tanks.current
+        assert view == [450, 500]
+
+        tanks.refill_each([10, 10])
+        assert view is tanks.current
+        assert view == [460, 500]
+
+
+class TestRefillBatch:
+    def test_refill_water_batch(self):
+        current = [100, 450, 0]
+
+        levels, statuses = refill_water_batch(current, [50, 100, 500],
+                                              [500, 500, 500])
+
+        assert levels == [150, 500, 500]
+        assert statuses == [WaterTankRefillStatus.STILL_NOT_FULL,
+                            WaterTankRefillStatus.NOW_FULL,
+                            WaterTankRefillStatus.NOW_FULL]
+        assert current == [100, 450, 0]
+
+    def test_refill_beans_batch(self):
+        levels, statuses = refill_beans_batch([10, 90], [5, 20], [100, 100])
+
+        assert levels == [15, 100]
+        assert statuses == [BeanContainerRefillStatus.STILL_NOT_FULL,
+                            BeanContainerRefillStatus.NOW_FULL]
+
+    @pytest.mark.parametrize(
+        "func, error",
+        [
+            (refill_water_batch, InvalidWaterOperationError),
+            (refill_beans_batch, InvalidBeanOperationError),
+        ],
+        ids=["water", "beans"]
+    )
+    def test_invalid_amount_raises(self, func, error):
+        with pytest.raises(error):
+            func([100, 100], [10, 0], [500, 500])
+
+    def test_length_mismatch_raises(self):
+        with pytest.raises(ValueError):
+            refill_water_batch([100, 100], [10], [500, 500])
@@ -0,0 +1,77 @@
+from src.coffee_machine.coffee_machine import (SimpleCoffeeMachine,
+                                               MachineState)
+from src.coffee_machine.coffee_recipe import CoffeeRecipe
+from src.coffee_machine.water_tank import WaterTank
+from src.coffee_machine.bean_container import BeanContainer
+from src.coffee_machine.fast_sim import simulate_brews
+from src.coffee_machine.policies.brew_policy import (DefaultBrewPolicy,
+                                                     BrewDecision)
+from src.coffee_machine.policies.cleaning_policy import DefaultCleaningPolicy
+from src.coffee_machine.policies.refill_policy import CapRefillPolicy
+import pytest
+
+
+def run_machine(n_brews, recipe, water_tank, bean_container, brew_policy,
+                cleaning_policy, refill_water_ml, refill_beans_g):
+    machine = SimpleCoffeeMachine(water_tank, bean_container, brew_policy,
+                                  cleaning_policy, CapRefillPolicy())
+    machine.select_recipe(recipe)
+    counts = dict.fromkeys(BrewDecision, 0)
+    for _ in range(n_brews):
+        decision = machine.brew()
+        counts[decision] += 1
+        if decision is BrewDecision.OUT_OF_WATER and refill_water_ml:
+            machine.refill_water(refill_water_ml)
+        elif decision is BrewDecision.OUT_OF_BEANS and refill_beans_g:
+            machine.refill_beans(refill_beans_g)
+        elif (decision is BrewDecision.NEEDS_CLEANING
+              or machine.state is MachineState.NEEDS_CLEANING):
+            machine.clean()
+    return counts
+
+
+@pytest.mark.parametrize(
+    "recipe, clean_threshold, schedule, immediate, refill_water, refill_beans",
+    [
+        (CoffeeRecipe("espresso", 30, 8), 5, 3, 6, 200, 50),
+        (CoffeeRecipe("espresso", 30, 8), 100, 3, 4, 200, 50),
+        (CoffeeRecipe("lungo", 60, 8), 10, 80, 120, 0, 0),
+        (CoffeeRecipe("water", 50, 0), 7, 1, 200, 120, 0),
+        (CoffeeRecipe("nothing", 0, 0), 5, 3, 6, 0, 0),
+    ],
+    ids=["clean_by_brew_policy", "clean_immediate", "no_refill",
+         "water_only", "forbidden"]
+)
+def test_simulate_brews_matches_machine(recipe, clean_threshold, schedule,
+                                        immediate, refill_water, refill_beans):
+    args = dict(
+        recipe=recipe,
+        brew_policy=DefaultBrewPolicy(clean_threshold=clean_threshold),
+        cleaning_policy=DefaultCleaningPolicy(schedule_threshold=schedule,
+                                              immediate_threshold=immediate),
+        refill_water_ml=refill_water,
+        refill_beans_g=refill_beans,
+    )
+    expected = run_machine(300, water_tank=WaterTank(500, 150),
+                           bean_container=BeanContainer(500, 50), **args)
+
+    water_tank = WaterTank(500, 150)
+    bean_container = BeanContainer(500, 50)
+    counts = simulate_brews(300, water_tank=water_tank,
+                            bean_container=bean_container, **args)
+
+    assert counts == expected
+    assert sum(counts.values()) == 300
+    # inputs are only read
+    assert water_tank.current_level == 150
+    assert bean_container.current_level == 50
+
+
+def test_simulate_brews_invalid_arguments():
+    args = (CoffeeRecipe("espresso", 30, 8), WaterTank(500, 150),
+            BeanContainer(500, 50), DefaultBrewPolicy(),
+            DefaultCleaningPolicy())
+    with pytest.raises(ValueError):
+        simulate_brews(-1, *args)
+    with pytest.raises(ValueError):
+        simulate_brews(10, *args, refill_water_ml=-5)
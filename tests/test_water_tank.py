@@ -160,3 +160,44 @@ class TestWaterTank:
     def test_fulfillment_ratio_edges(self):
         assert WaterTank(100, 0).fulfillment_ratio == pytest.approx(0.0)
         assert WaterTank(100, 100).fulfillment_ratio == pytest.approx(1.0)
+
+    def test_has_no_instance_dict(self):
+        tank = WaterTank(500, 200)
+        with pytest.raises(AttributeError):
+            tank.__dict__
+        with pytest.raises(AttributeError):
+            tank.unknown_attribute = 1
+
+    @pytest.mark.parametrize("attribute",
+                             ["current_level", "maximum_level"])
+    def test_levels_are_read_only(self, attribute):
+        container = WaterTank(500, 200)
+        with pytest.raises(AttributeError):
+            setattr(container, attribute, 900)
+        assert container.current_level == 200
+        assert container.maximum_level == 500
+        assert container.fulfillment_ratio == pytest.approx(0.4)
+
+    def test_class_is_final(self):
+        assert getattr(WaterTank, "__final__", False) is True
+
+    def test_fulfillment_ratio_follows_mutations(self):
+        tank = WaterTank(500, 200)
+        tank.consume_water(100)
+        assert tank.fulfillment_ratio == pytest.approx(0.2)
+
+        tank.refill(150)
+        assert tank.fulfillment_ratio == pytest.approx(0.5)
+
+        tank.refill(1000)
+        assert tank.fulfillment_ratio == pytest.approx(1.0)
+
+    def test_repr_follows_mutations(self):
+        tank = WaterTank(500, 200)
+        assert repr(tank) == "WaterTank(max=500,current=200)"
+
+        tank.consume_water(50)
+        assert repr(tank) == "WaterTank(max=500,current=150)"
+
+        tank.refill(1000)
+        assert repr(tank) == "WaterTank(max=500,current=500)"